@@ -6,39 +6,27 @@ A Python tool to draw images on your GitHub contribution graph by creating
 commits with custom dates. Enhanced with text generation, templates, and better visuals.
 
 Usage:
-    python contribution.py preview -img image.png
-    python contribution.py preview -text "HIRE ME"
-    python contribution.py push -img image.png -repo username/repo
-    python contribution.py push -template skull -repo username/repo
+    python contribution.py preview -input img:image.png
+    python contribution.py preview -input text:"HIRE ME"
+    python contribution.py push -input img:image.png -repo username/repo
+    python contribution.py push -input skull -repo username/repo
     python contribution.py list-templates
 """
 
-import argparse
+import functools
+import importlib.util
 import os
+import re
 import sys
 import subprocess
 import shutil
 from datetime import datetime, timedelta
-from PIL import Image, ImageDraw, ImageFont
-import numpy as np
 import tempfile
 import json
-import webbrowser
-import requests
 import logging
-import keyring
 
-try:
-    import colorama
-    colorama.init()
-    COLORAMA_AVAILABLE = True
-except ImportError:
-    COLORAMA_AVAILABLE = False
-
-GITHUB_KEYRING_SERVICE = 'github_contribution_generator_pat'
-GITHUB_PAT = None  # Global variable to store PAT for the session
-
-# Dependency check
+# Dependency check -- done with find_spec before the third-party imports
+# below, so a missing package gets this message instead of a traceback
 REQUIRED_PACKAGES = [
     ("numpy", "numpy"),
     ("PIL", "Pillow"),
@@ -46,12 +34,8 @@ REQUIRED_PACKAGES = [
     ("colorama", "colorama"),
     ("keyring", "keyring")
 ]
-missing = []
-for mod, pip_name in REQUIRED_PACKAGES:
-    try:
-        __import__(mod)
-    except ImportError:
-        missing.append(pip_name)
+missing = [pip_name for mod, pip_name in REQUIRED_PACKAGES
+           if importlib.util.find_spec(mod) is None]
 if missing:
     print("\nMissing required packages:")
     for pkg in missing:
@@ -59,6 +43,18 @@ if missing:
     print(f"\nPlease install them with:\n  pip install {' '.join(missing)}\n")
     sys.exit(1)
 
+import numpy as np
+
+try:
+    import colorama
+    colorama.init()
+    COLORAMA_AVAILABLE = True
+except ImportError:
+    COLORAMA_AVAILABLE = False
+
+GITHUB_KEYRING_SERVICE = 'github_contribution_generator_pat'
+GITHUB_PAT = None  # Global variable to store PAT for the session (loaded from keyring on first push)
+
 # Error logging
 logging.basicConfig(filename='github_contribution_generator.log',
                     level=logging.ERROR,
@@ -72,7 +68,30 @@ def log_uncaught_exceptions(exctype, value, tb):
 
 sys.excepthook = log_uncaught_exceptions
 
+def read_json(path):
+    """Load a JSON file, using orjson's faster parser when it is installed"""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def write_json(path, data):
+    """Write data as indented JSON, using orjson when it is installed"""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
 class ContributionGenerator:
+    _font_path = None  # Font file that loaded successfully, shared by all instances
+
     def __init__(self):
         self.GITHUB_WEEKS = 52
         self.GITHUB_DAYS = 7
@@ -96,8 +115,23 @@ class ContributionGenerator:
                 3: Back.YELLOW + '  ' + Style.RESET_ALL,
                 4: Back.WHITE + '  ' + Style.RESET_ALL
             }
+        # Indexed directly by intensity in the render loop
+        self._color_tuple = tuple(self.GITHUB_COLORS[i] for i in range(self.MAX_INTENSITY + 1))
+        # Object-array versions for mapping a whole matrix to strings at once
+        self._color_lut = np.array(self._color_tuple, dtype=object)
+        self._char_lut = np.array([' ', '░', '▒', '▓', '█'], dtype=object)
+        
+        # Grayscale value -> intensity (darker pixels = more contributions)
+        self._intensity_lut = [(255 - v) * self.MAX_INTENSITY // 255 for v in range(256)]
         
         self.templates = self._load_templates()
+        self._padded = self._pad_templates(self.templates)  # name -> 7x52 int8 grid
+        self._template_listing = {}  # isatty -> rendered list_templates output
+        self._font_cache = {}  # font_size -> loaded ImageFont
+        self._matrix_cache = {}  # input key -> processed contribution matrix
+        self._text_image_cache = {}  # (text, font_size) -> rendered text image
+        self._measure_draw = None  # 1x1 ImageDraw for measuring multi-line text
+        self._git_identity = None  # (author, committer) 'Name <email>' once git is checked
     
     def _load_templates(self):
         """Load built-in templates"""
@@ -152,43 +186,32 @@ class ContributionGenerator:
     
     def list_templates(self):
         """List available templates with previews"""
-        print("Available templates:\n")
-        
-        for name, pattern in self.templates.items():
-            print(f"🎨 {name.upper()}:")
-            # Convert to numpy array and pad to show properly  
-            template_array = np.array(pattern)
-            if template_array.shape[0] < self.GITHUB_DAYS:
-                # Pad with zeros to fit 7 days
-                pad_height = self.GITHUB_DAYS - template_array.shape[0]
-                template_array = np.pad(template_array, ((0, pad_height), (0, 0)), 'constant')
-            
-            # Resize to fit contribution graph if needed
-            if template_array.shape[1] > self.GITHUB_WEEKS:
-                template_array = template_array[:, :self.GITHUB_WEEKS]
-            elif template_array.shape[1] < self.GITHUB_WEEKS:
-                pad_width = self.GITHUB_WEEKS - template_array.shape[1]
-                template_array = np.pad(template_array, ((0, 0), (0, pad_width)), 'constant')
-            
-            # Show first 20 weeks for preview
-            preview_weeks = min(20, template_array.shape[1])
-            for day in range(self.GITHUB_DAYS):
-                print("   ", end="")
-                for week in range(preview_weeks):
-                    intensity = template_array[day, week] if day < template_array.shape[0] else 0
-                    if sys.stdout.isatty():  # Only use colors in terminal
-                        print(self.GITHUB_COLORS.get(intensity, '  '), end="")
-                    else:
-                        chars = [' ', '░', '▒', '▓', '█']
-                        print(chars[intensity], end="")
-                print()
-            print()
+        # The listing only changes when templates are imported, so the wizard
+        # renders it once per output mode (colors vs. characters)
+        tty = sys.stdout.isatty()
+        if tty not in self._template_listing:
+            parts = ["Available templates:\n\n"]
+            for name, template_array in self._padded.items():
+                parts.append(f"🎨 {name.upper()}:\n")
+                # Show first 20 weeks for preview
+                preview_weeks = min(20, template_array.shape[1])
+                parts.append(self._render_grid(template_array, ["   "] * self.GITHUB_DAYS,
+                                               preview_weeks) + "\n")
+            self._template_listing[tty] = "".join(parts)
+        sys.stdout.write(self._template_listing[tty])
     
-    def generate_text_image(self, text, font_size=8):
-        """Generate an image from text"""
-        # Create a large canvas first to get text dimensions
-        temp_img = Image.new('L', (1000, 100), color=255)
-        temp_draw = ImageDraw.Draw(temp_img)
+    def _render_grid(self, matrix, prefixes, weeks):
+        """Render the first `weeks` columns of a matrix as one string, one line per day"""
+        lut = self._color_lut if sys.stdout.isatty() else self._char_lut  # Only use colors in terminal
+        # One NumPy fancy-index maps every cell to its string
+        rendered = lut[matrix[:len(prefixes), :weeks]]
+        return "".join(prefix + "".join(row) + "\n" for prefix, row in zip(prefixes, rendered))
+    
+    def _get_font(self, font_size):
+        """Load a monospace font, reusing fonts already loaded at this size"""
+        if font_size in self._font_cache:
+            return self._font_cache[font_size]
+        from PIL import ImageFont
         font = None
         font_paths = [
             os.path.join(os.path.dirname(__file__), 'DejaVuSansMono.ttf'),
@@ -196,9 +219,13 @@ class ContributionGenerator:
             'Courier.ttf',
             'courier.ttf'
         ]
+        # Try the path that worked last time before walking the whole list
+        if ContributionGenerator._font_path:
+            font_paths.insert(0, ContributionGenerator._font_path)
         for font_path in font_paths:
             try:
                 font = ImageFont.truetype(font_path, font_size)
+                ContributionGenerator._font_path = font_path
                 break
             except Exception:
                 continue
@@ -210,8 +237,25 @@ class ContributionGenerator:
             except Exception:
                 print("\n❌ Error: No usable font found. Please install a monospace font like 'DejaVuSansMono.ttf' and try again.\n")
                 sys.exit(1)
-        # Get text dimensions
-        bbox = temp_draw.textbbox((0, 0), text, font=font)
+        self._font_cache[font_size] = font
+        return font
+    
+    def generate_text_image(self, text, font_size=8):
+        """Generate an image from text"""
+        # The wizard renders the same text for the preview and the pop-up image
+        key = (text, font_size)
+        if key in self._text_image_cache:
+            return self._text_image_cache[key].copy()
+        from PIL import Image, ImageDraw
+        font = self._get_font(font_size)
+        # Get text dimensions straight from the font, no scratch canvas needed;
+        # getbbox only measures one line, so multi-line text goes through ImageDraw
+        if '\n' in text:
+            if self._measure_draw is None:
+                self._measure_draw = ImageDraw.Draw(Image.new('L', (1, 1)))
+            bbox = self._measure_draw.multiline_textbbox((0, 0), text, font=font)
+        else:
+            bbox = font.getbbox(text)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         # Create properly sized image
@@ -219,7 +263,8 @@ class ContributionGenerator:
         draw = ImageDraw.Draw(img)
         # Draw text in black
         draw.text((2, 2), text, font=font, fill=0)
-        return img
+        self._text_image_cache[key] = img
+        return img.copy()
     
     def load_template(self, template_name):
         """Load a template pattern"""
@@ -229,9 +274,16 @@ class ContributionGenerator:
                 print(f"  - {name}")
             sys.exit(1)
         
-        pattern = np.array(self.templates[template_name])
-        
-        # Pad to fit GitHub contribution graph dimensions
+        return self._padded[template_name].copy()
+    
+    def _pad_templates(self, templates):
+        """Pad/crop template patterns to the 7x52 contribution grid"""
+        # Clamp to 0..MAX_INTENSITY so every cell indexes the render LUTs safely
+        return {name: self._pad_to_grid(np.clip(np.array(pattern), 0, self.MAX_INTENSITY).astype(np.int8))
+                for name, pattern in templates.items()}
+    
+    def _pad_to_grid(self, pattern):
+        """Pad or crop a pattern to fit GitHub contribution graph dimensions"""
         if pattern.shape[0] < self.GITHUB_DAYS:
             pad_height = self.GITHUB_DAYS - pattern.shape[0]
             pattern = np.pad(pattern, ((0, pad_height), (0, 0)), 'constant')
@@ -239,39 +291,47 @@ class ContributionGenerator:
         if pattern.shape[1] < self.GITHUB_WEEKS:
             pad_width = self.GITHUB_WEEKS - pattern.shape[1]
             pattern = np.pad(pattern, ((0, 0), (0, pad_width)), 'constant')
-        elif pattern.shape[1] > self.GITHUB_WEEKS:
-            pattern = pattern[:, :self.GITHUB_WEEKS]
         
-        return pattern[:self.GITHUB_DAYS, :self.GITHUB_WEEKS]
+        return np.ascontiguousarray(pattern[:self.GITHUB_DAYS, :self.GITHUB_WEEKS])
     
     def load_and_process_image(self, image_path=None, text=None, template=None):
         """Load image, text, or template and convert to GitHub contribution format"""
         try:
             if template:
                 return self.load_template(template)
-            elif text:
-                img = self.generate_text_image(text)
-            else:
-                img = Image.open(image_path).convert('L')
-            
-            # Resize to 52x7 (GitHub contribution graph dimensions)
-            img = img.resize((self.GITHUB_WEEKS, self.GITHUB_DAYS), Image.Resampling.LANCZOS)
-            
-            # Convert to numpy array and normalize to 0-4 intensity levels
-            img_array = np.array(img)
-            
-            # Invert (darker pixels = more contributions)
-            img_array = 255 - img_array
             
-            # Normalize to 0-4 range
-            img_array = (img_array / 255.0 * self.MAX_INTENSITY).astype(int)
-            
-            return img_array
+            # Preview and push in the same session reuse the processed matrix;
+            # images are keyed by mtime so an edited file is picked up again
+            if text:
+                key = ('text', text)
+            else:
+                key = ('image', image_path, os.path.getmtime(image_path))
+            if key not in self._matrix_cache:
+                self._matrix_cache[key] = self._process_input(image_path, text)
+            return self._matrix_cache[key].copy()
             
+        except FileNotFoundError:
+            raise  # Callers report missing files themselves
         except Exception as e:
             print(f"Error processing input: {e}")
             sys.exit(1)
     
+    def _process_input(self, image_path=None, text=None):
+        """Convert image or text input to a contribution matrix"""
+        from PIL import Image
+        if text:
+            img = self.generate_text_image(text)
+        else:
+            img = Image.open(image_path).convert('L')
+        
+        # Resize to 52x7 (GitHub contribution graph dimensions)
+        img = img.resize((self.GITHUB_WEEKS, self.GITHUB_DAYS), Image.Resampling.LANCZOS)
+        
+        # Invert and normalize to 0-4 intensity levels in one C pass, then convert
+        img_array = np.asarray(img.point(self._intensity_lut), dtype=np.int8)
+        
+        return img_array
+    
     def preview_contribution_graph(self, image_path=None, text=None, template=None):
         """Preview the contribution graph without pushing to GitHub"""
         print("Processing input...")
@@ -287,39 +347,26 @@ class ContributionGenerator:
         # Print header with month indicators (approximate)
         months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        print("     ", end="")
-        for i in range(0, self.GITHUB_WEEKS, 4):
-            month_idx = (i // 4) % 12
-            print(f"{months[month_idx]:<4}", end="")
-        print()
+        header = "     " + "".join(f"{months[(i // 4) % 12]:<4}"
+                                   for i in range(0, self.GITHUB_WEEKS, 4)) + "\n"
         
         # Days of the week
         days = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
         
-        for day in range(self.GITHUB_DAYS):
-            print(f"{days[day]} ", end="")
-            for week in range(self.GITHUB_WEEKS):
-                intensity = contribution_matrix[day, week]
-                
-                # Use GitHub colors in terminal, fallback to characters elsewhere
-                if sys.stdout.isatty():
-                    print(self.GITHUB_COLORS.get(intensity, '  '), end="")
-                else:
-                    chars = [' ', '░', '▒', '▓', '█']
-                    print(chars[intensity], end="")
-                
-            print()  # New line after each day
+        # Build the whole frame first and write it in one go
+        sys.stdout.write(header + self._render_grid(contribution_matrix,
+                                                    [f"{day} " for day in days],
+                                                    self.GITHUB_WEEKS))
         
+        active_days = np.count_nonzero(contribution_matrix)
         print(f"\n📊 Statistics:")
-        print(f"   Total contribution days: {np.sum(contribution_matrix > 0)}")
+        print(f"   Total contribution days: {active_days}")
         print(f"   Total commits: {np.sum(contribution_matrix)}")
         print(f"   Max daily commits: {np.max(contribution_matrix)}")
-        print(f"   Coverage: {np.sum(contribution_matrix > 0) / (self.GITHUB_WEEKS * self.GITHUB_DAYS) * 100:.1f}%")
+        print(f"   Coverage: {active_days / (self.GITHUB_WEEKS * self.GITHUB_DAYS) * 100:.1f}%")
     
     def generate_commit_dates(self, contribution_matrix, weeks_ago=0):
         """Generate commit dates based on contribution matrix"""
-        commits = []
-        
         # Calculate the start date (52 weeks ago from now, plus offset)
         today = datetime.now()
         start_date = today - timedelta(weeks=52 + weeks_ago)
@@ -329,55 +376,56 @@ class ContributionGenerator:
         if days_since_sunday == 7:
             days_since_sunday = 0
         start_date = start_date - timedelta(days=days_since_sunday)
-        
-        for week in range(self.GITHUB_WEEKS):
-            for day in range(self.GITHUB_DAYS):
-                intensity = contribution_matrix[day, week]
-                if intensity > 0:
-                    # Calculate the date for this day
-                    commit_date = start_date + timedelta(weeks=week, days=day)
-                    
-                    # Add multiple commits for higher intensity
-                    for commit_num in range(intensity):
-                        # Spread commits throughout the day
-                        hour = 9 + (commit_num * 3) % 14  # 9 AM to 11 PM
-                        minute = (commit_num * 17) % 60
-                        commit_time = commit_date.replace(hour=hour, minute=minute)
-                        commits.append(commit_time)
-        
-        return commits
+        base = np.datetime64(start_date.date(), 's')
+
+        # Seconds from start_date (midnight) to each cell, laid out like the matrix
+        day_offsets = (np.arange(self.GITHUB_WEEKS)[None, :] * 7 +
+                       np.arange(self.GITHUB_DAYS)[:, None]) * 86400
+        matrix = contribution_matrix[:self.GITHUB_DAYS, :self.GITHUB_WEEKS]
+
+        # Add multiple commits for higher intensity
+        commits = []
+        for commit_num in range(int(matrix.max(initial=0))):
+            # Spread commits throughout the day
+            hour = 9 + (commit_num * 3) % 14  # 9 AM to 11 PM
+            minute = (commit_num * 17) % 60
+            cells = day_offsets[matrix > commit_num]
+            commits.append(cells + (hour * 3600 + minute * 60))
+
+        if not commits:
+            return []
+
+        # Chronological order, converted to datetimes only once at the end
+        offsets = np.sort(np.concatenate(commits))
+        return (base + offsets.astype('timedelta64[s]')).tolist()
     
     def push_to_github(self, repo, branch="contribution", weeks_ago=0, 
                       image_path=None, text=None, template=None, dry_run=False):
         """Create commits and push to GitHub repository"""
         global GITHUB_PAT
+        # Load the input first so a bad input is reported before git problems
+        print("Processing input...")
+        contribution_matrix = self.load_and_process_image(image_path, text, template)
         if not self.check_git_requirements():
             print("\nPlease make sure Git is installed and configured before continuing.\nYou can download Git from https://git-scm.com/downloads\n")
             return
-        print("Processing input...")
-        contribution_matrix = self.load_and_process_image(image_path, text, template)
         print("Generating commit dates...")
         commit_dates = self.generate_commit_dates(contribution_matrix, weeks_ago)
         if not commit_dates:
             print("❌ No commits to create (input is empty or too light). Try using a darker image, bolder text, or a different template.")
             return
-        print(f"📅 Will create {len(commit_dates)} commits over {np.sum(contribution_matrix > 0)} days")
+        print(f"📅 Will create {len(commit_dates)} commits over {np.count_nonzero(contribution_matrix)} days")
         print("\n🔍 Quick preview:")
-        for day in range(min(7, self.GITHUB_DAYS)):
-            print("   ", end="")
-            for week in range(min(20, self.GITHUB_WEEKS)):
-                intensity = contribution_matrix[day, week]
-                if sys.stdout.isatty():
-                    print(self.GITHUB_COLORS.get(intensity, '  '), end="")
-                else:
-                    chars = [' ', '░', '▒', '▓', '█']
-                    print(chars[intensity], end="")
-            print()
+        sys.stdout.write(self._render_grid(contribution_matrix, ["   "] * self.GITHUB_DAYS,
+                                           min(20, self.GITHUB_WEEKS)))
         print(f"\n⚠️  This will create {len(commit_dates)} commits in your repository: {repo}")
         print("This will overwrite the branch if it already exists.")
         if dry_run:
             print("\n[DRY RUN] No changes will be made. This is a simulation.\n")
             return
+        # Look up a stored PAT now, so a keyring problem shows before confirming
+        if GITHUB_PAT is None:
+            GITHUB_PAT = get_stored_pat() or None
         response = input("Do you want to continue? Type 'yes' to proceed, or anything else to cancel: ")
         if response.lower() != 'yes':
             print("Cancelled. No changes were made.")
@@ -388,25 +436,39 @@ class ContributionGenerator:
     
     def check_git_requirements(self):
         """Check if git is available and configured"""
-        try:
-            # Check if git is installed
-            subprocess.run(['git', '--version'], check=True, capture_output=True)
-            
-            # Check if git is configured
-            try:
-                subprocess.run(['git', 'config', 'user.name'], check=True, capture_output=True)
-                subprocess.run(['git', 'config', 'user.email'], check=True, capture_output=True)
-            except subprocess.CalledProcessError:
-                print("❌ Git is not configured. Please set your name and email:")
-                print("   git config --global user.name 'Your Name'")
-                print("   git config --global user.email 'your.email@example.com'")
-                return False
-                
+        if self._git_identity:
             return True
-            
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        try:
+            # A single `git config --list` both proves git runs and gives name/email.
+            # It runs outside any repository, like the commits in the fresh temp
+            # repo, so a local user.email of the caller's cwd isn't picked up
+            result = subprocess.run(['git', 'config', '--list'], capture_output=True, text=True,
+                                    cwd=tempfile.gettempdir())
+        except FileNotFoundError:
             print("❌ Git is not installed or not available in PATH")
             return False
+        
+        # Later entries (e.g. global over system) win, as they do for git itself
+        config = {}
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition('=')
+            config[key] = value
+        if not config.get('user.name') or not config.get('user.email'):
+            print("❌ Git is not configured. Please set your name and email:")
+            print("   git config --global user.name 'Your Name'")
+            print("   git config --global user.email 'your.email@example.com'")
+            return False
+        
+        # Same precedence `git commit` uses: GIT_<ROLE>_* environment, then
+        # <role>.* config, then user.*
+        def ident(role):
+            name = (os.environ.get(f'GIT_{role.upper()}_NAME') or config.get(f'{role}.name')
+                    or config['user.name'])
+            email = (os.environ.get(f'GIT_{role.upper()}_EMAIL') or config.get(f'{role}.email')
+                     or config['user.email'])
+            return f"{name} <{email}>"
+        self._git_identity = (ident('author'), ident('committer'))
+        return True
     
     def create_git_repository(self, temp_dir, repo, branch, commit_dates, 
                             image_path=None, text=None, template=None):
@@ -447,38 +509,61 @@ Each commit represents a pixel in the final image on the GitHub contribution gra
 Total commits: {len(commit_dates)}
 """
             
-            with open('README.md', 'w') as f:
-                f.write(readme_content)
-            
-            # Create commits with custom dates
+            # Identities for the generated commits, as found by check_git_requirements
+            author, committer = (ident.encode() for ident in self._git_identity)
+            ref = f"refs/heads/{branch}".encode()
+
+            # Create commits with custom dates, streamed to a single
+            # `git fast-import` process instead of one `git commit` per pixel
             print("🚀 Creating commits...")
             total_commits = len(commit_dates)
-            
-            for i, commit_date in enumerate(commit_dates):
-                # Update README to make each commit unique
-                with open('README.md', 'a') as f:
-                    f.write(f"\n<!-- Commit {i+1} at {commit_date} -->")
-                
-                subprocess.run(['git', 'add', '.'], check=True, capture_output=True)
-                
-                # Format date for git
-                date_str = commit_date.strftime("%Y-%m-%d %H:%M:%S")
-                
-                # Create commit with custom date
-                env = os.environ.copy()
-                env['GIT_AUTHOR_DATE'] = date_str
-                env['GIT_COMMITTER_DATE'] = date_str
-                
-                commit_msg = f"Art pixel {i+1}/{total_commits}"
-                subprocess.run([
-                    'git', 'commit', '-m', commit_msg
-                ], env=env, check=True, capture_output=True)
+            fast_import = subprocess.Popen(['git', 'fast-import', '--date-format=raw',
+                                            '--quiet', '--done'],
+                                           stdin=subprocess.PIPE,
+                                           stdout=subprocess.PIPE,
+                                           stderr=subprocess.PIPE)
+            readme = readme_content.encode()
+
+            try:
+                # The README is stored once; every commit shares the same tree,
+                # so the pack holds a single blob plus the commit objects
+                fast_import.stdin.write(b"blob\nmark :1\ndata %d\n%s\n" % (len(readme), readme))
+
+                for i, commit_date in enumerate(commit_dates):
+                    # Raw git date: epoch seconds plus the local UTC offset, both
+                    # taken from a single local-time resolution of the naive date
+                    local_date = commit_date.astimezone()
+                    date_raw = b"%d %s" % (int(local_date.timestamp()), local_date.strftime('%z').encode())
+                    commit_msg = f"Art pixel {i+1}/{total_commits}".encode()
+
+                    commit_mark = i + 2
+                    record = [
+                        b"commit %s\nmark :%d\n" % (ref, commit_mark),
+                        b"author %s %s\ncommitter %s %s\n" % (author, date_raw, committer, date_raw),
+                        b"data %d\n" % len(commit_msg), commit_msg, b"\n",
+                    ]
+                    if i == 0:
+                        record.append(b"M 100644 :1 README.md\n")
+                    else:
+                        record.append(b"from :%d\n" % (commit_mark - 1))
+                    record.append(b"\n")
+                    fast_import.stdin.write(b"".join(record))
+
+                    # Progress indicator
+                    if (i + 1) % 25 == 0 or i == total_commits - 1:
+                        progress = (i + 1) / total_commits * 100
+                        print(f"   Progress: {i+1}/{total_commits} ({progress:.1f}%)")
                 
-                # Progress indicator
-                if (i + 1) % 25 == 0 or i == total_commits - 1:
-                    progress = (i + 1) / total_commits * 100
-                    print(f"   Progress: {i+1}/{total_commits} ({progress:.1f}%)")
-            
+                # With --done, a stream cut short is rejected instead of half-imported
+                fast_import.stdin.write(b"done\n")
+            except BrokenPipeError:
+                pass  # fast-import exited early; its stderr is reported below
+
+            _, stderr = fast_import.communicate()
+            if fast_import.returncode != 0:
+                raise subprocess.CalledProcessError(fast_import.returncode, fast_import.args,
+                                                    stderr=stderr)
+
             print("✅ All commits created!")
             
             # Push to GitHub
@@ -492,12 +577,18 @@ Total commits: {len(commit_dates)}
                 print(f"📊 Contribution graph: https://github.com/{repo.split('/')[0]}")
                 open_browser = input("Would you like to open your repository in your web browser now? (y/N): ")
                 if open_browser.strip().lower() == 'y':
+                    import webbrowser
                     webbrowser.open(f"https://github.com/{repo}")
             else:
                 print(f"❌ Error pushing to GitHub: {result.stderr}\nPlease check your repository name, your network connection, and that you have write access.")
                 
         except subprocess.CalledProcessError as e:
-            print(f"❌ Git operation failed: {e}\nPlease check your Git configuration and try again.")
+            # The exception's message leaves out git's own explanation
+            details = e.stderr.decode(errors='replace').strip() if e.stderr else ''
+            if details:
+                print(f"❌ Git operation failed: {e}\n{details}\nPlease check your Git configuration and try again.")
+            else:
+                print(f"❌ Git operation failed: {e}\nPlease check your Git configuration and try again.")
         except Exception as e:
             print(f"❌ Error: {e}\nIf you need help, please check the documentation or ask for support.")
         finally:
@@ -505,20 +596,21 @@ Total commits: {len(commit_dates)}
 
     def import_templates(self, json_path):
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
+            data = read_json(json_path)
             if not isinstance(data, dict):
                 print("❌ Invalid template file format.")
                 return
+            padded = self._pad_templates(data)
             self.templates.update(data)
+            self._padded.update(padded)
+            self._template_listing = {}
             print(f"✅ Imported {len(data)} templates from {json_path}.")
         except Exception as e:
             print(f"❌ Error importing templates: {e}")
 
     def export_templates(self, json_path):
         try:
-            with open(json_path, 'w') as f:
-                json.dump(self.templates, f, indent=2)
+            write_json(json_path, self.templates)
             print(f"✅ Exported {len(self.templates)} templates to {json_path}.")
         except Exception as e:
             print(f"❌ Error exporting templates: {e}")
@@ -530,13 +622,20 @@ Total commits: {len(commit_dates)}
 
 
 def get_stored_pat():
-    return keyring.get_password(GITHUB_KEYRING_SERVICE, 'github_pat')
+    import keyring
+    from keyring.errors import KeyringError
+    try:
+        return keyring.get_password(GITHUB_KEYRING_SERVICE, 'github_pat')
+    except KeyringError:
+        return None  # No usable keyring backend; the push falls back to SSH
 
 def save_pat(pat):
+    import keyring
     keyring.set_password(GITHUB_KEYRING_SERVICE, 'github_pat', pat)
 
 def connect_github_account():
     global GITHUB_PAT
+    import requests
     print("\nTo push to your GitHub account, you can use a Personal Access Token (PAT).\n")
     print("If you don't have one, you can create it here: https://github.com/settings/tokens\n")
     print("Recommended scopes: 'repo' (for private repos) or 'public_repo' (for public repos).\n")
@@ -561,9 +660,6 @@ def connect_github_account():
     except Exception as e:
         print(f"❌ Error connecting to GitHub: {e}\n")
 
-# On startup, try to load a stored PAT
-GITHUB_PAT = get_stored_pat() or None
-
 I18N = {
     'en': {
         'welcome': "Welcome to the GitHub Contribution Graph Art Wizard!",
@@ -633,6 +729,7 @@ def wizard_mode():
             # Ask if user wants to see a pop-up image preview
             show_img = input("Would you like to see a pop-up image preview? (y/N): ").strip().lower()
             if show_img == 'y':
+                from PIL import Image
                 # Generate the image and show it
                 if template:
                     arr = generator.load_template(template)
@@ -691,75 +788,140 @@ def wizard_mode():
             print(_( 'invalid_choice') + "\n")
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="🎨 Draw images, text, or templates on your GitHub contribution graph",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+COMMANDS = ('list-templates', 'preview', 'push')
+_REPO_RE = re.compile(r'[^/\s]+/[^/\s]+')  # username/repo
+INPUT_KINDS = ('img', 'text', 'template')
+_INPUT_HELP = 'What to draw: img:PATH, text:TEXT or a template name (use list-templates to see options)'
+
+_EPILOG = """
 Examples:
-  python contribution.py preview -img skull.png
-  python contribution.py preview -text "HIRE ME" 
-  python contribution.py preview -template heart
-  python contribution.py push -text "PYTHON" -repo myuser/contribution-art
+  python contribution.py preview -input img:skull.png
+  python contribution.py preview -input text:"HIRE ME" 
+  python contribution.py preview -input heart
+  python contribution.py push -input text:"PYTHON" -repo myuser/contribution-art
   python contribution.py list-templates
   python contribution.py --wizard
   python contribution.py
   
 🚨 Important: Create an empty GitHub repository first!
-        """
-    )
+"""
+
+# Top-level help, frozen so `-h` doesn't have to build and format a parser
+_STATIC_HELP = """usage: {prog} [-h] [--wizard] <command> ...
+
+🎨 Draw images, text, or templates on your GitHub contribution graph
+
+commands:
+  list-templates      Show available templates
+  preview             Preview contribution graph
+  push                Push contribution graph to GitHub
+
+options:
+  -h, --help          show this help message and exit
+  --wizard            Launch interactive guided mode
+
+Use '{prog} <command> -h' to see the options for a command.
+""" + _EPILOG
+
+def _print_static_help():
+    print(_STATIC_HELP.format(prog=os.path.basename(sys.argv[0])))
+
+def _parse_input(value):
+    """Split a -input TYPE:VAL value into (image_path, text, template)"""
+    kind, sep, val = value.partition(':')
+    # A bare value is a template name
+    if not sep:
+        kind, val = 'template', kind
+    if kind not in INPUT_KINDS:
+        sys.exit(f"❌ Error: Unknown input type '{kind}' (use img:PATH, text:TEXT or a template name)")
+    if not val:
+        sys.exit(f"❌ Error: No value given for input type '{kind}'")
+    # The shell doesn't expand ~ after "img:", so do it here
+    if kind == 'img':
+        val = os.path.expanduser(val)
+    return tuple(val if k == kind else None for k in INPUT_KINDS)
+
+
+def _build_subparser(name, subparsers):
+    """Add the subparser for a single command"""
+    if name == 'list-templates':
+        # List templates command
+        subparsers.add_parser('list-templates', help='Show available templates')
+    elif name == 'preview':
+        # Preview command
+        preview_parser = subparsers.add_parser('preview', help='Preview contribution graph')
+        preview_parser.add_argument('-input', required=True, metavar='TYPE:VAL', help=_INPUT_HELP)
+    elif name == 'push':
+        # Push command
+        push_parser = subparsers.add_parser('push', help='Push contribution graph to GitHub')
+        push_parser.add_argument('-input', required=True, metavar='TYPE:VAL', help=_INPUT_HELP)
+        push_parser.add_argument('-repo', required=True, help='GitHub repository (username/repo)')
+        push_parser.add_argument('-branch', default='contribution', help='Git branch (default: contribution)')
+        push_parser.add_argument('-w', type=int, default=0, 
+                               help='Weeks ago offset (moves pattern left)')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_parser(commands):
+    """Build the argument parser with subparsers for `commands` (cached)"""
+    import argparse  # Only the command line needs it; importing the module doesn't
+    # Top-level help is static (_STATIC_HELP); each command keeps its own -h
+    parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument('--wizard', action='store_true', help='Launch interactive guided mode')
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    for name in commands:
+        _build_subparser(name, subparsers)
+    return parser
+
+
+def main():
+    argv = sys.argv[1:]
+    command = next((arg for arg in argv if not arg.startswith('-')), None)
     
-    # List templates command
-    list_parser = subparsers.add_parser('list-templates', help='Show available templates')
-    
-    # Preview command
-    preview_parser = subparsers.add_parser('preview', help='Preview contribution graph')
-    input_group = preview_parser.add_mutually_exclusive_group(required=True)
-    input_group.add_argument('-img', help='Path to image file')
-    input_group.add_argument('-text', help='Text to convert to pixels')
-    input_group.add_argument('-template', help='Template name (use list-templates to see options)')
+    # -h/--help before any command prints the static help without a parser
+    top_level = argv[:argv.index(command)] if command else argv
+    if '-h' in top_level or '--help' in top_level:
+        _print_static_help()
+        return
     
-    # Push command  
-    push_parser = subparsers.add_parser('push', help='Push contribution graph to GitHub')
-    push_input_group = push_parser.add_mutually_exclusive_group(required=True)
-    push_input_group.add_argument('-img', help='Path to image file')
-    push_input_group.add_argument('-text', help='Text to convert to pixels') 
-    push_input_group.add_argument('-template', help='Template name')
-    push_parser.add_argument('-repo', required=True, help='GitHub repository (username/repo)')
-    push_parser.add_argument('-branch', default='contribution', help='Git branch (default: contribution)')
-    push_parser.add_argument('-w', type=int, default=0, 
-                           help='Weeks ago offset (moves pattern left)')
+    # The wizard needs no argument parsing at all
+    if not argv or '--wizard' in argv:
+        wizard_mode()
+        return
     
-    args = parser.parse_args()
+    # Only build the subparser for the command being run; errors get all of
+    # them so the usage message still lists every command
+    commands = (command,) if command in COMMANDS else COMMANDS
+    args = _get_parser(commands).parse_args()
     
-    if args.wizard or len(sys.argv) == 1:
+    # Abbreviations such as --wiz only resolve to --wizard while parsing
+    if args.wizard:
         wizard_mode()
         return
     
     if not args.command:
-        parser.print_help()
+        _print_static_help()
         return
     
-    generator = ContributionGenerator()
+    if args.command == 'push' and not _REPO_RE.fullmatch(args.repo):
+        sys.exit(f"❌ Error: Repository '{args.repo}' must be in the form username/repo")
     
-    if args.command == 'list-templates':
-        generator.list_templates()
-    elif args.command == 'preview':
-        # Check if image file exists (only for image input)
-        if args.img and not os.path.exists(args.img):
-            print(f"❌ Error: Image file '{args.img}' not found")
-            sys.exit(1)
-        generator.preview_contribution_graph(args.img, args.text, args.template)
-    elif args.command == 'push':
-        # Check if image file exists (only for image input)
-        if args.img and not os.path.exists(args.img):
-            print(f"❌ Error: Image file '{args.img}' not found")
-            sys.exit(1)
-        generator.push_to_github(args.repo, args.branch, args.w, 
-                               args.img, args.text, args.template)
-
+    if args.command in ('preview', 'push'):
+        image_path, text, template = _parse_input(args.input)
+    
+    # The generator is only built once the command and its arguments check out
+    generator = ContributionGenerator()
+    # A missing image file surfaces from the loader itself (only for image input)
+    try:
+        if args.command == 'list-templates':
+            generator.list_templates()
+        elif args.command == 'preview':
+            generator.preview_contribution_graph(image_path, text, template)
+        elif args.command == 'push':
+            generator.push_to_github(args.repo, args.branch, args.w, 
+                                   image_path, text, template)
+    except FileNotFoundError as e:
+        sys.exit(f"❌ Error: Image file '{e.filename}' not found")
 
 if __name__ == "__main__":
     main()